@@ -2,12 +2,18 @@
 using hackaton_microsoft_agro.Interface;
 using hackaton_microsoft_agro.Services;
 using Microsoft.AspNetCore.Antiforgery;
+using Microsoft.EntityFrameworkCore;
+using Microsoft.Extensions.Caching.Memory;
 using System.IO;
 
 namespace hackaton_microsoft_agro.Endpoints
 {
     public static class Endpoints
     {
+        // Cache of the registered-products lookups, bounded because the key comes from user input.
+        // It is private to this endpoint so the size limit does not apply to any other cache consumer.
+        static readonly MemoryCache RegisteredProductsCache = new MemoryCache(new MemoryCacheOptions { SizeLimit = 1024 });
+
         public static void AddMyEndpoints(this WebApplication app)
         {
             app.MapGet("/health", () => new Dictionary<string, string> { ["status"] = "up" }).WithName("HealthCheck");
@@ -21,7 +27,7 @@ namespace hackaton_microsoft_agro.Endpoints
                 try
                 {
                     byte[] imageContent = await client.GetByteArrayAsync(url);
-                    var result = orchestrator.ProcessRequest(text: null, image: imageContent);
+                    var result = await orchestrator.ProcessRequestAsync(text: null, image: imageContent);
 
                     return Results.Ok(result);
                 }
@@ -44,10 +50,10 @@ namespace hackaton_microsoft_agro.Endpoints
                     if (file == null || file.Length == 0 || !file.ContentType.StartsWith("image"))
                         return Results.BadRequest("No file uploaded or incorrect format.");
 
-                    using (var stream = new MemoryStream())
+                    using (var stream = new MemoryStream((int)file.Length))
                     {
                         await file.CopyToAsync(stream);
-                        var result = orchestrator.ProcessRequest(text: null, image: stream.ToArray());
+                        var result = await orchestrator.ProcessRequestAsync(text: null, image: stream.ToArray());
                         return Results.Ok(result);
                     }
                 }
@@ -70,10 +76,9 @@ namespace hackaton_microsoft_agro.Endpoints
                     if (file == null || file.Length == 0)
                         return Results.BadRequest("No file uploaded or incorrect format.");
 
-                    using (var stream = new MemoryStream())
+                    using (var stream = file.OpenReadStream())
                     {
-                        await file.CopyToAsync(stream);
-                        var result = await Task.Run(() => speechService.SpeechToText(stream.ToArray()));
+                        var result = await speechService.SpeechToText(stream);
                         return Results.Ok(new SpeechToTextResponse(result));
                     }
                 }
@@ -90,7 +95,7 @@ namespace hackaton_microsoft_agro.Endpoints
             .DisableAntiforgery();
 
 
-            app.MapGet("/control_insect_suggestion", (string pest, IOrchestrator orchestrator) =>
+            app.MapGet("/control_insect_suggestion", async (string pest, IOrchestrator orchestrator) =>
             {
 
                 if (string.IsNullOrEmpty(pest))
@@ -98,7 +103,7 @@ namespace hackaton_microsoft_agro.Endpoints
 
                 try
                 {
-                    var result = orchestrator.ProcessRequest(text: "Suggest control to " + pest);
+                    var result = await orchestrator.ProcessRequestAsync(text: "Suggest control to " + pest);
 
                     return Results.Ok(result);
                 }
@@ -114,7 +119,7 @@ namespace hackaton_microsoft_agro.Endpoints
             .WithName("ControlInsectSuggestion");
 
 
-            app.MapGet("/question", (string question, HttpClient client, IOrchestrator orchestrator) =>
+            app.MapGet("/question", async (string question, HttpClient client, IOrchestrator orchestrator) =>
             {
 
                 if (string.IsNullOrEmpty(question))
@@ -122,7 +127,7 @@ namespace hackaton_microsoft_agro.Endpoints
 
                 try
                 {
-                    var result = orchestrator.ProcessRequest(text: question);
+                    var result = await orchestrator.ProcessRequestAsync(text: question);
                     return Results.Ok(result);
                 }
                 catch (ArgumentException ex)
@@ -137,21 +142,35 @@ namespace hackaton_microsoft_agro.Endpoints
             .WithName("Question");
 
 
-            app.MapGet("/get_registered_products", (CropProtectionContext database, string pest) =>
+            app.MapGet("/get_registered_products", async (CropProtectionContext database, string pest) =>
             {
-                return database.Products
-                         .Where(x => x.PestCommonName.ToUpper().Contains(pest.ToUpper()))
-                         .Select(c => new CropProtectionDto
-                         (
-                             c.Id,
-                             c.RegistrationNumber,
-                             c.CommercialBrand,
-                             c.Class,
-                             c.Crop,
-                             c.PestScientificName,
-                             c.PestCommonName.Replace('?', 'a')
-                         ))
-                         .Take(20);
+                // The products database does not change while the API is running, so the
+                // result for a pest is kept for a while and reused by the following requests.
+                // The match ignores case, so the key does too.
+                return await RegisteredProductsCache.GetOrCreateAsync("registered_products:" + pest.ToLowerInvariant(), async entry =>
+                {
+                    entry.Size = 1;
+                    entry.AbsoluteExpirationRelativeToNow = TimeSpan.FromMinutes(10);
+
+                    // SQLite LIKE is already case-insensitive, so there is no need to upper-case every row.
+                    // Wildcards typed by the user are escaped so they are matched literally.
+                    var pattern = "%" + pest.Replace("\\", "\\\\").Replace("%", "\\%").Replace("_", "\\_") + "%";
+
+                    return await database.Products
+                             .Where(x => EF.Functions.Like(x.PestCommonName, pattern, "\\"))
+                             .Select(c => new CropProtectionDto
+                             (
+                                 c.Id,
+                                 c.RegistrationNumber,
+                                 c.CommercialBrand,
+                                 c.Class,
+                                 c.Crop,
+                                 c.PestScientificName,
+                                 c.PestCommonName.Replace('?', 'a')
+                             ))
+                             .Take(20)
+                             .ToListAsync();
+                });
             })
             .WithName("GetRegisteredProducts");
         }
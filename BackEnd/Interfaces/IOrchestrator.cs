@@ -2,6 +2,6 @@
 {
     public interface IOrchestrator
     {
-        public Dictionary<string, string> ProcessRequest(string? text = null, byte[]? image = null);
+        public Task<Dictionary<string, string>> ProcessRequestAsync(string? text = null, byte[]? image = null);
     }
 }
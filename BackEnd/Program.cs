@@ -6,6 +6,7 @@ using hackaton_microsoft_agro.Models;
 using hackaton_microsoft_agro.Services;
 using Microsoft.AspNetCore.Antiforgery;
 using Microsoft.OpenApi.Models;
+using System.Diagnostics;
 using System.Formats.Asn1;
 using System.Globalization;
 
@@ -39,11 +40,25 @@ builder.Services.AddOpenApi();
 // Add HTTP Client Service
 builder.Services.AddHttpClient();
 
+// Connection pool shared by the Azure service clients, so the sockets opened
+// by one request are kept alive and reused by the following ones.
+var azureHttpClient = new HttpClient(new SocketsHttpHandler
+{
+    PooledConnectionLifetime = TimeSpan.FromMinutes(5),
+    PooledConnectionIdleTimeout = TimeSpan.FromMinutes(2),
+    MaxConnectionsPerServer = 64,
+    // Redirects and cookies are left to the SDK pipelines, as their own transports do,
+    // so the service keys are not replayed to a redirect target.
+    AllowAutoRedirect = false,
+    UseCookies = false
+});
+
 // Add Orchestrator Service
 builder.Services.AddSingleton<IOrchestrator, Orchestrator>(o => new Orchestrator(
     new ContentSafety(
         builder.Configuration["content-safety-endpoint"]!,
-        builder.Configuration["content-safety-key"]!),
+        builder.Configuration["content-safety-key"]!,
+        azureHttpClient),
 
     new CustomVision(
         builder.Configuration["custom-vision-endpoint"]!,
@@ -53,12 +68,14 @@ builder.Services.AddSingleton<IOrchestrator, Orchestrator>(o => new Orchestrator
 
     new AISearch(
         builder.Configuration["ai-search-endpoint"]!,
-        builder.Configuration["ai-search-key"]!),
+        builder.Configuration["ai-search-key"]!,
+        azureHttpClient),
 
      new OpenAIService(
         builder.Configuration["openai-endpoint"]!,
         builder.Configuration["openai-key"]!,
-        builder.Configuration["openai-deployment-name"]!)
+        builder.Configuration["openai-deployment-name"]!,
+        azureHttpClient)
     )
 );
 
@@ -83,6 +100,36 @@ builder.Services.AddCors(options =>
 
 var app = builder.Build();
 
+// Warm up the database at startup, so the first user request does not pay for
+// building the EF Core model and opening SQLite. The orchestrator is resolved
+// too, which only constructs the service clients; no connection is opened.
+// A failure here is logged and the app still starts, so the endpoints that do
+// not need the failing piece keep working.
+var warmup = Stopwatch.StartNew();
+try
+{
+    using (var scope = app.Services.CreateScope())
+    {
+        scope.ServiceProvider.GetRequiredService<CropProtectionContext>().Products.Take(1).ToList();
+    }
+    app.Logger.LogInformation("Database warm-up finished in {ElapsedMilliseconds} ms.", warmup.ElapsedMilliseconds);
+}
+catch (Exception ex)
+{
+    app.Logger.LogWarning(ex, "Database warm-up failed after {ElapsedMilliseconds} ms.", warmup.ElapsedMilliseconds);
+}
+
+warmup.Restart();
+try
+{
+    app.Services.GetRequiredService<IOrchestrator>();
+    app.Logger.LogInformation("Orchestrator created in {ElapsedMilliseconds} ms.", warmup.ElapsedMilliseconds);
+}
+catch (Exception ex)
+{
+    app.Logger.LogWarning(ex, "Orchestrator creation failed after {ElapsedMilliseconds} ms.", warmup.ElapsedMilliseconds);
+}
+
 if (app.Environment.IsDevelopment())
 {
     app.UseSwagger();
@@ -1,19 +1,19 @@
 using System.Drawing;
 using Azure;
+using Azure.Core.Pipeline;
 using Azure.Search.Documents;
 using Azure.Search.Documents.Models;
 
 namespace hackaton_microsoft_agro.Services
 {
 
-    public class AISearch(string endpoint, string apiKey)
+    public class AISearch(string endpoint, string apiKey, HttpClient httpClient)
     {
-        SearchClient searchClient = new SearchClient(new Uri(endpoint), "vector-agro-01", new AzureKeyCredential(apiKey));
+        SearchClient searchClient = new SearchClient(new Uri(endpoint), "vector-agro-01", new AzureKeyCredential(apiKey),
+            new SearchClientOptions { Transport = new HttpClientTransport(httpClient) });
 
-        public List<string> Search(string searchText, int size = 5)
+        public async Task<List<string>> SearchAsync(string searchText, int size = 5)
         {
-            HttpClient httpClient = new HttpClient();
-
             try
             {
                 var options = new SearchOptions
@@ -21,10 +21,10 @@ namespace hackaton_microsoft_agro.Services
                     Size = size
                 };
 
-                var searchResults = searchClient.Search<SearchDocument>(searchText, options);
+                var searchResults = await searchClient.SearchAsync<SearchDocument>(searchText, options);
                 var textResults = new List<string>();
 
-                foreach (var document in searchResults.Value.GetResults())
+                await foreach (var document in searchResults.Value.GetResultsAsync())
                 {
                     textResults.Add(document.Document["chunk"]+"\n source:"+ document.Document["title"]);
                 }
@@ -33,7 +33,7 @@ namespace hackaton_microsoft_agro.Services
             }
             catch (Exception ex)
             {
-                throw new Exception("Error Search -> " + ex.Message);
+                throw new Exception("Error SearchAsync -> " + ex.Message);
             }
 
         }
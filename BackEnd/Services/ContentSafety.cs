@@ -1,20 +1,22 @@
 ﻿using Azure;
 using Azure.AI.ContentSafety;
+using Azure.Core.Pipeline;
 using Microsoft.AspNetCore.DataProtection.KeyManagement;
 
 namespace hackaton_microsoft_agro.Services
 {
-    public class ContentSafety(string endpoint, string key)
+    public class ContentSafety(string endpoint, string key, HttpClient httpClient)
     {
-        ContentSafetyClient contentSafetyClient = new ContentSafetyClient(new Uri(endpoint), new AzureKeyCredential(key));
+        ContentSafetyClient contentSafetyClient = new ContentSafetyClient(new Uri(endpoint), new AzureKeyCredential(key),
+            new ContentSafetyClientOptions { Transport = new HttpClientTransport(httpClient) });
 
-        public void ValidateContent(byte[]? image, string? text)
+        public async Task ValidateContentAsync(byte[]? image, string? text)
         {
-            if (ContentAnalyze(image, text))
+            if (await ContentAnalyzeAsync(image, text))
                 throw new ArgumentException("Text or image contains inappropriate content.");
         }
 
-        private bool ContentAnalyze(byte[]? image, string? text)
+        private async Task<bool> ContentAnalyzeAsync(byte[]? image, string? text)
         {
             bool resultImage = false;
             bool resultText = false;
@@ -24,37 +26,37 @@ namespace hackaton_microsoft_agro.Services
                 if (image != null)
                 {
                     var request = new AnalyzeImageOptions(new ContentSafetyImageData(BinaryData.FromBytes(image)));
-                    resultImage = IsInappropriateImage(contentSafetyClient.AnalyzeImage(request));
+                    resultImage = IsInappropriateImage(await contentSafetyClient.AnalyzeImageAsync(request));
                 }
 
                 if (text != null)
                 {
                     var request = new AnalyzeTextOptions(text);
-                    resultText = IsInappropriateText(contentSafetyClient.AnalyzeText(request));
+                    resultText = IsInappropriateText(await contentSafetyClient.AnalyzeTextAsync(request));
                 }
             }
             catch (Exception ex)
             {
-                throw new Exception("Error ContentAnalyze -> " + ex.Message);
+                throw new Exception("Error ContentAnalyzeAsync -> " + ex.Message);
             }
 
             return resultImage || resultText;
         }
 
+        static readonly HashSet<ImageCategory> InappropriateImageCategories =
+            [ImageCategory.Hate, ImageCategory.SelfHarm, ImageCategory.Sexual, ImageCategory.Violence];
+
+        static readonly HashSet<TextCategory> InappropriateTextCategories =
+            [TextCategory.Hate, TextCategory.SelfHarm, TextCategory.Sexual, TextCategory.Violence];
+
         bool IsInappropriateImage(Response<AnalyzeImageResult> response)
         {
-            return (response.Value.CategoriesAnalysis.FirstOrDefault(item => item.Category == ImageCategory.Hate)?.Severity > 0) ||
-            (response.Value.CategoriesAnalysis.FirstOrDefault(item => item.Category == ImageCategory.SelfHarm)?.Severity > 0) ||
-            (response.Value.CategoriesAnalysis.FirstOrDefault(item => item.Category == ImageCategory.Sexual)?.Severity > 0) ||
-            (response.Value.CategoriesAnalysis.FirstOrDefault(item => item.Category == ImageCategory.Violence)?.Severity > 0);
+            return response.Value.CategoriesAnalysis.Any(item => item.Severity > 0 && InappropriateImageCategories.Contains(item.Category));
         }
 
         bool IsInappropriateText(Response<AnalyzeTextResult> response)
         {
-            return (response.Value.CategoriesAnalysis.FirstOrDefault(item => item.Category == TextCategory.Hate)?.Severity > 0) ||
-            (response.Value.CategoriesAnalysis.FirstOrDefault(item => item.Category == TextCategory.SelfHarm)?.Severity > 0) ||
-            (response.Value.CategoriesAnalysis.FirstOrDefault(item => item.Category == TextCategory.Sexual)?.Severity > 0) ||
-            (response.Value.CategoriesAnalysis.FirstOrDefault(item => item.Category == TextCategory.Violence)?.Severity > 0);
+            return response.Value.CategoriesAnalysis.Any(item => item.Severity > 0 && InappropriateTextCategories.Contains(item.Category));
         }
     }
 }
@@ -14,13 +14,13 @@ namespace hackaton_microsoft_agro.Services
             Endpoint = endpoint
         };
 
-        public (string, double) AnalyseImageContent(byte[] image)
+        public async Task<(string, double)> AnalyseImageContentAsync(byte[] image)
         {
             var predictions = new Dictionary<string, double>();
 
             using (MemoryStream imageStream = new MemoryStream(image))
             {
-                var results = predictor.ClassifyImage(projectId, iterationName, imageStream);
+                var results = await predictor.ClassifyImageAsync(projectId, iterationName, imageStream);
 
                 foreach (var prediction in results.Predictions)
                 {
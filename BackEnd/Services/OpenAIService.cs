@@ -3,6 +3,7 @@ using Azure;
 using Azure.AI.OpenAI;
 using hackaton_microsoft_agro.Data;
 using OpenAI.Chat;
+using System.ClientModel.Primitives;
 using System.Runtime.InteropServices;
 using System.Runtime.Intrinsics.X86;
 
@@ -10,11 +11,13 @@ using System.Runtime.Intrinsics.X86;
 namespace hackaton_microsoft_agro.Services
 {
 
-    public class OpenAIService(string endpoint, string apiKey, string deploymentName)
+    public class OpenAIService(string endpoint, string apiKey, string deploymentName, HttpClient httpClient)
     {
-        AzureOpenAIClient client = new AzureOpenAIClient(new Uri(endpoint), new AzureKeyCredential(apiKey));
+        ChatClient chatClient = new AzureOpenAIClient(new Uri(endpoint), new AzureKeyCredential(apiKey),
+            new AzureOpenAIClientOptions { Transport = new HttpClientPipelineTransport(httpClient) })
+            .GetChatClient(deploymentName);
 
-        public string ProcessResponse(string query, string sources)
+        public async Task<string> ProcessResponseAsync(string query, string sources)
         {
             string GROUNDED_PROMPT = $"""
                                     You are a friendly assistant who assists agricultural professionals with planting and pest control in soybeans.
@@ -31,12 +34,12 @@ namespace hackaton_microsoft_agro.Services
 
                 chatMessages.Add(ChatMessage.CreateUserMessage(GROUNDED_PROMPT));
 
-                var response = client.GetChatClient(deploymentName).CompleteChat(chatMessages);
+                var response = await chatClient.CompleteChatAsync(chatMessages);
                 return response.Value.Content[0].Text;
             }
             catch (Exception ex)
             {
-                throw new Exception($"Error ProcessResponse -> " + ex.Message);
+                throw new Exception($"Error ProcessResponseAsync -> " + ex.Message);
             }
         }
 
@@ -15,36 +15,45 @@ namespace hackaton_microsoft_agro.Services
             The recommendation can only be made by a qualified professional. An agronomic prescription must be issued. The information is researched and the response generated by generative AI and it is necessary to verify at the source whether the information is accurate.
             """";
 
-        public Dictionary<string, string> ProcessRequest(string? query, byte[]? image)
+        public async Task<Dictionary<string, string>> ProcessRequestAsync(string? query, byte[]? image)
         {
             string? pestClassification = null;
 
             // Validate content using Azure ContentSafety
-            contentSafety.ValidateContent(image, query);
+            var validation = contentSafety.ValidateContentAsync(image, query);
 
-            // Perform Azure Custom Vision image classification if an image is provided
+            // Perform Azure Custom Vision image classification if an image is provided.
+            // The classification does not depend on the validation, so both calls run at the same time.
             if (image != null)
-                (pestClassification, query) = AnalyseImage(image);
+            {
+                var analysis = AnalyseImageAsync(image);
+                await Task.WhenAll(validation, analysis);
+                (pestClassification, query) = await analysis;
+            }
+            else
+            {
+                await validation;
+            }
 
             // Check if the query is null or empty
             if (string.IsNullOrEmpty(query))
                   return CreateResponse(pestClassification, "No query.");
 
             // Perform Azure AI Search and OpenAI RAG
-            var response = GetAISearchResponse(query);
+            var response = await GetAISearchResponseAsync(query);
 
             // Return final response
             return CreateResponse(pestClassification, response);
         }
 
-        public (string pest, string query) AnalyseImage(byte[]? image)
+        public async Task<(string pest, string query)> AnalyseImageAsync(byte[]? image)
         {
             string query = "";
 
             if (image == null)
                 throw new ArgumentException("Image data is invalid.");
 
-            (string pest, double confidence) = customVision.AnalyseImageContent(image);
+            (string pest, double confidence) = await customVision.AnalyseImageContentAsync(image);
 
             if (confidence >= 0.75)
                 query = $"Suggest control for {pest}";
@@ -54,10 +63,10 @@ namespace hackaton_microsoft_agro.Services
             return (pest: pest, query: query);
         }
 
-        private string GetAISearchResponse(string query)
+        private async Task<string> GetAISearchResponseAsync(string query)
         {
-            var searchResults = aISearch.Search(query, 5);
-            return openAI.ProcessResponse(query, string.Join(" ", searchResults));
+            var searchResults = await aISearch.SearchAsync(query, 5);
+            return await openAI.ProcessResponseAsync(query, string.Join(" ", searchResults));
         }
 
         private Dictionary<string, string> CreateResponse(string? pestResult, string response)
@@ -5,17 +5,31 @@ namespace hackaton_microsoft_agro.Services
 {
     public class SpeechService(string apiKey, string region)
     {
-        SpeechConfig config = SpeechConfig.FromSubscription(apiKey, region);
+        SpeechConfig config = CreateConfig(apiKey, region);
 
-        public async Task<string> SpeechToText(byte[] audio)
+        static SpeechConfig CreateConfig(string apiKey, string region)
         {
+            var speechConfig = SpeechConfig.FromSubscription(apiKey, region);
+            speechConfig.SpeechRecognitionLanguage = "en-US";
+            return speechConfig;
+        }
+
+        public async Task<string> SpeechToText(Stream audio)
+        {
+            string? tempFilePath = null;
+
             try
             {
-                var tempFilePath = Path.GetTempFileName();
-                File.WriteAllBytes(tempFilePath, audio);
-                using var audioConfig = AudioConfig.FromWavFileInput(tempFilePath);
+                tempFilePath = Path.GetTempFileName();
 
-                config.SpeechRecognitionLanguage = "en-US";
+                // The recognizer reads from a file, so the upload is copied straight to disk
+                // instead of being buffered in memory first.
+                using (var tempFile = File.Create(tempFilePath))
+                {
+                    await audio.CopyToAsync(tempFile);
+                }
+
+                using var audioConfig = AudioConfig.FromWavFileInput(tempFilePath);
                 using var recognizer = new SpeechRecognizer(config, audioConfig);
 
                 var result = await recognizer.RecognizeOnceAsync();
@@ -42,6 +56,11 @@ namespace hackaton_microsoft_agro.Services
             {
                 throw new ArgumentException("Error processing the audio file -> SpeechToText: " + ex.Message);
             }
+            finally
+            {
+                if (tempFilePath != null)
+                    File.Delete(tempFilePath);
+            }
         }
     }
 }
\ No newline at end of file
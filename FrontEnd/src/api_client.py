@@ -1,7 +1,47 @@
 import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import InsecureRequestWarning
+from urllib3.util.retry import Retry
 
 API_HOST = 'http://localhost:5080'
 
+# (connect, read) timeouts in seconds. The read timeout is long because the
+# classification and question endpoints wait for the language model.
+REQUEST_TIMEOUT = (3.05, 60)
+
+urllib3.disable_warnings(InsecureRequestWarning)
+
+# A single session shared by all the calls, so the connections to the API are
+# kept alive and reused instead of being opened again on every request.
+# Read timeouts are not retried: a slow answer means the backend is already
+# running the whole AI pipeline, and sending the request again repeats it.
+_SESSION = requests.Session()
+_SESSION.verify = False
+_ADAPTER = HTTPAdapter(pool_connections= 10, pool_maxsize= 20,
+                       max_retries= Retry(total= 3, read= False, backoff_factor= 0.2, status_forcelist= [429, 502, 503],
+                                         raise_on_status= False))
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
+
+def _request(method, path, **kwargs):
+    """
+    Send a request to the API through the shared session.
+
+    Args:
+        method (str): The HTTP method.
+        path (str): The endpoint path, starting with a slash.
+
+    Returns:
+        The JSON response from the API if all OK or None otherwise, including
+        when the request times out or the API cannot be reached.
+    """
+    try:
+        response = _SESSION.request(method, f"{API_HOST}{path}", timeout= REQUEST_TIMEOUT, **kwargs)
+        return response.json() if response.status_code == 200 else None
+    except requests.RequestException:
+        return None
+
 class ApiClient:
     @staticmethod
     def classify_pest_image(image_url):
@@ -14,8 +54,7 @@ class ApiClient:
         Returns:
             The response from the API if all OK or None otherwise.
         """
-        response = requests.post("http://localhost:5080/classify_pest", params={"url": image_url})
-        return response.json() if response.status_code == 200 else None
+        return _request("POST", "/classify_pest", params={"url": image_url})
     
     @staticmethod
     def classify_pest_file(file_name, file_contents, file_type):
@@ -31,8 +70,7 @@ class ApiClient:
             The response from the API if all OK or None otherwise.
         """
         files = {'file': (file_name, file_contents, file_type)}
-        response = requests.post(f"{API_HOST}/classify_pest_file", files=files)
-        return response.json() if response.status_code == 200 else None
+        return _request("POST", "/classify_pest_file", files=files)
     
     @staticmethod
     def get_question_answer(question):
@@ -45,8 +83,7 @@ class ApiClient:
         Returns:
             The response from the API if all OK or None otherwise.
         """
-        response = requests.get(f'{API_HOST}/question/', params= {'question': question}, verify= False)
-        return response.json() if response.status_code == 200 else None
+        return _request("GET", "/question/", params= {'question': question})
     
     @staticmethod
     def get_registered_products(pest_name):
@@ -59,8 +96,7 @@ class ApiClient:
         Returns:
             The response from the API if all OK or None otherwise.
         """
-        response = requests.get(f'{API_HOST}/get_registered_products', params= {'pest': pest_name}, verify= False)
-        return response.json() if response.status_code == 200 else None
+        return _request("GET", "/get_registered_products", params= {'pest': pest_name})
 
     @staticmethod
     def health_check():
@@ -70,8 +106,7 @@ class ApiClient:
         Returns:
             The response from the API if all OK or None otherwise.
         """
-        response = requests.get(f'{API_HOST}/health', verify= False)
-        return response.json() if response.status_code == 200 else None
+        return _request("GET", "/health")
     
     @staticmethod
     def transcribe_audio_file(file_name, file_contents, file_type):
@@ -87,5 +122,4 @@ class ApiClient:
             The response from the API if all OK or None otherwise
         """
         files = {'file': (file_name, file_contents, file_type)}
-        response = requests.post(f"{API_HOST}/speech_to_text", files=files)
-        return response.json() if response.status_code == 200 else None
+        return _request("POST", "/speech_to_text", files=files)
@@ -17,6 +17,8 @@ config_path = os.path.join(os.path.dirname(__file__), "config.yaml")
 with open(config_path, "r") as f:
     config = yaml.safe_load(f)
 
+chat_history_path = os.path.join(os.path.dirname(__file__), config["chat_history_path"])
+
 
 def clear_input_field():
     if st.session_state.user_question == "":
@@ -37,6 +39,12 @@ def set_send_url():
     clear_url_field()
 
 
+def get_pest_name_db(pest_classification):
+    # The database stores pest names in lower case with dashes, without the
+    # parenthesized part of the classification tag.
+    return pest_classification.partition("(")[0].strip().lower().replace(" ", "-")
+
+
 def process_speech():
     print("processing speech")
 
@@ -48,9 +56,9 @@ def save_chat_history():
     if st.session_state.history != []:
         if st.session_state.session_key == "new_session":
             st.session_state.new_session_key = get_timestamp() + ".json"
-            save_chat_history_json(st.session_state.history, os.listdir(os.path.join(os.path.dirname(__file__), config["chat_history_path"])) + st.session_state.new_session_key)
+            save_chat_history_json(st.session_state.history, os.path.join(chat_history_path, st.session_state.new_session_key))
         else:
-            save_chat_history_json(st.session_state.history, os.listdir(os.path.join(os.path.dirname(__file__), config["chat_history_path"])) + st.session_state.session_key)
+            save_chat_history_json(st.session_state.history, os.path.join(chat_history_path, st.session_state.session_key))
 
 
 def main():
@@ -84,7 +92,7 @@ def main():
     st.write(css, unsafe_allow_html=True)
     
     st.sidebar.title("Chat Sessions")
-    chat_sessions = ["new_session"] + os.listdir(os.path.join(os.path.dirname(__file__), config["chat_history_path"]))
+    chat_sessions = ["new_session"] + os.listdir(chat_history_path)
    
     if st.session_state.session_key == "new_session" and st.session_state.new_session_key != None:
         st.session_state.session_index_tracker = st.session_state.new_session_key
@@ -95,7 +103,7 @@ def main():
     st.sidebar.selectbox("Select a chat session", chat_sessions, key="session_key", index=index)
 
     if st.session_state.session_key != "new_session":
-        st.session_state.history = load_chat_history_json(os.listdir(os.path.join(os.path.dirname(__file__), config["chat_history_path"])) + st.session_state.session_key)
+        st.session_state.history = load_chat_history_json(os.path.join(chat_history_path, st.session_state.session_key))
     else:
         st.session_state.history = []
 
@@ -158,8 +166,7 @@ def main():
 
             pest = ApiClient.classify_pest_file(uploaded_image.name, uploaded_image.read(), uploaded_image.type)
             if pest is not None:
-                pest_name_db = pest['pestClassification'].split("(")[0].lower().strip()
-                pest_name_db = pest_name_db.replace(" ", "-")
+                pest_name_db = get_pest_name_db(pest['pestClassification'])
 
                 # Get registered products for this pest.
                 products = ApiClient.get_registered_products(pest_name_db)
@@ -192,9 +199,8 @@ def main():
             container.image(st.session_state.user_image_url, caption="Image URL indicated by the user.", width= 600)
             pest = ApiClient.classify_pest_image(st.session_state.user_image_url)
             if pest is not None:
-                pest_name_db = pest['pestClassification'].split("(")[0].lower().strip()
-                pest_name_db = pest_name_db.replace(" ", "-")
-                
+                pest_name_db = get_pest_name_db(pest['pestClassification'])
+
                 # Get registered products for this pest.
                 products = ApiClient.get_registered_products(pest_name_db)
                 if products is not None: